@@ -230,7 +230,7 @@ def _deep_compare(
         if _is_number(a) and _is_number(b):
             pass  # allow numeric comparison
         else:
-            logger.debug(f"[TYPE MISMATCH] {path_str}: {type(a).__name__} vs {type(b).__name__}")
+            logger.debug("[TYPE MISMATCH] %s: %s vs %s", path_str, type(a).__name__, type(b).__name__)
             return False
 
     # Dict comparison
@@ -240,9 +240,9 @@ def _deep_compare(
             missing_in_a = keys_b - keys_a
             missing_in_b = keys_a - keys_b
             if missing_in_a:
-                logger.debug(f"[KEY MISMATCH] {path_str}: Missing in left dict → {sorted(missing_in_a)}")
+                logger.debug("[KEY MISMATCH] %s: Missing in left dict → %s", path_str, sorted(missing_in_a))
             if missing_in_b:
-                logger.debug(f"[KEY MISMATCH] {path_str}: Missing in right dict → {sorted(missing_in_b)}")
+                logger.debug("[KEY MISMATCH] %s: Missing in right dict → %s", path_str, sorted(missing_in_b))
             return False
 
         for k in a:
@@ -250,15 +250,15 @@ def _deep_compare(
                 a[k], b[k], path + (k,),
                 abs_tol, rel_tol, abs_tol_fields, rel_tol_fields, epsilon, show_debug,
             ):
-                logger.debug(f"[FAIL IN DICT] {path_str}.{k}")
+                logger.debug("[FAIL IN DICT] %s.%s", path_str, k)
                 return False
-        logger.debug(f"[MATCH] {path_str}: dict OK")
+        logger.debug("[MATCH] %s: dict OK", path_str)
         return True
 
     # List comparison
     if isinstance(a, list):
         if len(a) != len(b):
-            logger.debug(f"[LIST LENGTH MISMATCH] {path_str}: {len(a)} vs {len(b)}")
+            logger.debug("[LIST LENGTH MISMATCH] %s: %d vs %d", path_str, len(a), len(b))
             return False
 
         for i, (x, y) in enumerate(zip(a, b)):
@@ -266,9 +266,9 @@ def _deep_compare(
                 x, y, path + (i,),
                 abs_tol, rel_tol, abs_tol_fields, rel_tol_fields, epsilon, show_debug,
             ):
-                logger.debug(f"[FAIL IN LIST] {path_str}[{i}]")
+                logger.debug("[FAIL IN LIST] %s[%d]", path_str, i)
                 return False
-        logger.debug(f"[MATCH] {path_str}: list OK")
+        logger.debug("[MATCH] %s: list OK", path_str)
         return True
 
     # Numeric comparison
@@ -279,21 +279,21 @@ def _deep_compare(
         threshold = max(local_abs, local_rel * max(abs(a_val), abs(b_val)))
 
         logger.debug(
-            f"[NUMERIC COMPARE] {path_str}: {a_val} vs {b_val} | "
-            f"diff={diff:.6f} | abs_tol={local_abs} | rel_tol={local_rel} | threshold={threshold:.6f}"
+            "[NUMERIC COMPARE] %s: %s vs %s | diff=%.6f | abs_tol=%s | rel_tol=%s | threshold=%.6f",
+            path_str, a_val, b_val, diff, local_abs, local_rel, threshold,
         )
 
         result = math.isclose(a_val, b_val, abs_tol=local_abs + epsilon, rel_tol=local_rel)
         if not result:
-            logger.debug(f"[FAIL NUMERIC] {path_str} → diff={diff:.6f} > threshold={threshold:.6f}")
+            logger.debug("[FAIL NUMERIC] %s → diff=%.6f > threshold=%.6f", path_str, diff, threshold)
         else:
-            logger.debug(f"[MATCH NUMERIC] {path_str}: within tolerance")
+            logger.debug("[MATCH NUMERIC] %s: within tolerance", path_str)
         return result
 
     # Generic value comparison
     if a != b:
-        logger.debug(f"[VALUE MISMATCH] {path_str}: {a!r} != {b!r}")
+        logger.debug("[VALUE MISMATCH] %s: %r != %r", path_str, a, b)
         return False
 
-    logger.debug(f"[MATCH] {path_str}: OK → {a!r}")
+    logger.debug("[MATCH] %s: OK → %r", path_str, a)
     return True
@@ -1,6 +1,11 @@
+import logging
+
+import pytest
+
+import dictlens.core
 from dictlens.core import compare_dicts
 
-debug = True
+debug = False
 
 
 # --------------------------------------------------------------------------
@@ -13,21 +18,16 @@ def test_identical_dicts():
     assert compare_dicts(a, b, show_debug=debug)
 
 
-def test_simple_value_mismatch():
-    a = {"x": 1}
-    b = {"x": 2}
-    assert not compare_dicts(a, b, show_debug=debug)
-
-
-def test_type_mismatch():
-    a = {"x": 1}
-    b = {"x": "1"}
-    assert not compare_dicts(a, b, show_debug=debug)
-
-
-def test_key_mismatch():
-    a = {"x": 1}
-    b = {"y": 1}
+@pytest.mark.parametrize(
+    "a, b",
+    [
+        ({"x": 1}, {"x": 2}),
+        ({"x": 1}, {"x": "1"}),
+        ({"x": 1}, {"y": 1}),
+    ],
+    ids=["value", "type", "key"],
+)
+def test_basic_mismatch(a, b):
     assert not compare_dicts(a, b, show_debug=debug)
 
 
@@ -297,5 +297,43 @@ def test_combined_global_and_field_tolerances():
         abs_tol_fields=abs_tol_fields,
         rel_tol_fields=rel_tol_fields,
         ignore_fields=ignore_fields,
-        show_debug=True
+        show_debug=debug
     )
+
+
+# --------------------------------------------------------------------------
+# 8️⃣ DEBUG LOGGING — captured via caplog, no stream handler attached
+# --------------------------------------------------------------------------
+
+def test_debug_log_explains_mismatch(caplog):
+    caplog.set_level(logging.DEBUG, logger="dictlens.core")
+    a = {"sensor": {"temp": 20.0}}
+    b = {"sensor": {"temp": 21.0}}
+    assert not compare_dicts(a, b, abs_tol=0.5)
+    assert "[FAIL NUMERIC] $.sensor.temp" in caplog.text
+    fail_in_dict = [m for m in caplog.messages if m.startswith("[FAIL IN DICT]")]
+    # Innermost failure first, then one line per enclosing dict level.
+    assert len(fail_in_dict) == 2
+    assert fail_in_dict[0] == "[FAIL IN DICT] $.sensor.temp"
+
+
+# --------------------------------------------------------------------------
+# 9️⃣ SHOW_DEBUG — logger level set by compare_dicts, isolated per test
+# --------------------------------------------------------------------------
+
+@pytest.fixture
+def clean_logger(monkeypatch):
+    """Isolated dictlens logger; handlers and level are restored on teardown."""
+    logger = dictlens.core.logger
+    saved_level = logger.level
+    monkeypatch.setattr(logger, "handlers", [])
+    logger.setLevel(logging.WARNING)
+    yield logger
+    logger.setLevel(saved_level)
+    # setLevel must clear the isEnabledFor cache, or DEBUG leaks into later tests.
+    assert logger.isEnabledFor(logging.DEBUG) == (logger.getEffectiveLevel() <= logging.DEBUG)
+
+
+def test_show_debug_sets_logger_level(clean_logger):
+    assert compare_dicts({"temp": 20.0}, {"temp": 20.1}, abs_tol=0.5, show_debug=True)
+    assert clean_logger.level == logging.DEBUG